@@ -0,0 +1,39 @@
+"""
+QLab app configuration.
+
+Hosts the optional metadata prewarm: with PREWARM_METADATA enabled, the
+per-model metadata JSON cache is populated once at process start so the
+first metadata request per model hits warm bytes instead of paying the
+model walk and serialization cost.
+"""
+
+from django.apps import AppConfig
+
+
+class QLabConfig(AppConfig):
+    name = "qlab"
+    verbose_name = "QLab"
+
+    def ready(self):
+        from qlab.settings import qlab_settings
+
+        if not qlab_settings.get("PREWARM_METADATA", False):
+            return
+
+        from django.apps import apps
+
+        from qlab.helpers import get_model_metadata_json
+
+        max_depth = qlab_settings.MAX_RELATION_DEPTH
+        for model in apps.get_models():
+            try:
+                get_model_metadata_json(
+                    model._meta.object_name,
+                    app_label=model._meta.app_label,
+                    max_depth=max_depth,
+                )
+            except Exception:
+                # Prewarming is best-effort; a model that cannot be
+                # introspected here will simply be built lazily on first
+                # request, as before.
+                continue
@@ -8,6 +8,8 @@ This module provides core functionality for:
 - Operation validation per field type
 """
 
+import json
+from functools import lru_cache
 from typing import List, Optional
 from django.apps import apps
 from django.db.models import ForeignKey, ManyToManyField
@@ -20,12 +22,133 @@ from django.db.models.fields.related import (
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from django.db.models import Q
-import re
 
 from qlab.model_validation import Filter, Condition
 from qlab.settings import qlab_settings
 
 
+# ---------------------------------------------------------------------------
+# Field type / operation tables
+#
+# Hoisted to module scope so the dicts are built once at import time instead
+# of on every call — get_field_type_name, get_allowed_operations and
+# check_attribute_operation run for every field during metadata extraction
+# and for every condition during validation.
+# ---------------------------------------------------------------------------
+
+# Django field class -> string type name for frontend consumption
+_FIELD_TYPE_NAMES = {
+    models.CharField: "string",
+    models.TextField: "text",
+    models.EmailField: "email",
+    models.URLField: "url",
+    models.SlugField: "slug",
+    models.IntegerField: "integer",
+    models.BigIntegerField: "bigint",
+    models.SmallIntegerField: "smallint",
+    models.PositiveIntegerField: "positiveint",
+    models.FloatField: "float",
+    models.DecimalField: "decimal",
+    models.BooleanField: "boolean",
+    models.DateField: "date",
+    models.DateTimeField: "datetime",
+    models.TimeField: "time",
+    models.ForeignKey: "foreignkey",
+    models.OneToOneField: "onetoone",
+    models.ManyToManyField: "manytomany",
+    models.UUIDField: "uuid",
+    models.JSONField: "json",
+    models.FileField: "file",
+    models.ImageField: "image",
+}
+
+# Django field class -> operations advertised in metadata responses
+_FIELD_OPS = {
+    # --- Text fields: support equality and substring search ---
+    models.CharField: ("is", "is_not", "icontains"),
+    models.TextField: ("is", "is_not", "icontains"),
+    models.EmailField: ("is", "is_not", "icontains"),
+    models.SlugField: ("is", "is_not", "icontains"),
+    models.URLField: ("is", "is_not", "icontains"),
+    models.FilePathField: ("is", "is_not", "icontains"),
+    models.GenericIPAddressField: ("is", "is_not", "icontains"),
+    # --- Numeric fields: support equality and comparison ---
+    models.IntegerField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    models.FloatField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    models.DecimalField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    models.PositiveIntegerField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    models.BigIntegerField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    models.SmallIntegerField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    # --- Boolean: only equality checks ---
+    models.BooleanField: ("is", "is_not"),
+    # --- Date/time fields: support equality and comparison ---
+    models.DateField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    models.DateTimeField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    models.TimeField: ("is", "is_not", "lt", "lte", "gt", "gte"),
+    # --- Relations: equality only (or contains for M2M) ---
+    models.ForeignKey: ("is", "is_not"),
+    models.OneToOneField: ("is", "is_not"),
+    models.ManyToManyField: ("is", "is_not", "icontains"),
+    # --- Special types ---
+    models.UUIDField: ("is", "is_not", "icontains"),
+    models.JSONField: ("is", "is_not", "icontains"),
+    models.FileField: ("is", "is_not"),
+    models.ImageField: ("is", "is_not"),
+}
+
+# Extra text lookups accepted by check_attribute_operation but not advertised
+# in metadata — kept as a delta so _FIELD_OPS stays the single source of truth.
+_EXTRA_VALIDATION_OPS = {
+    models.CharField: ("iexact", "startswith", "endswith"),
+    models.TextField: ("iexact", "startswith", "endswith"),
+    models.EmailField: ("iexact",),
+    models.SlugField: ("iexact",),
+    models.URLField: ("iexact",),
+    models.GenericIPAddressField: ("iexact",),
+    models.UUIDField: ("iexact",),
+}
+
+# Django field class -> full set of operations accepted during validation
+_VALIDATION_FIELD_OPS = {
+    field_type: frozenset(ops).union(_EXTRA_VALIDATION_OPS.get(field_type, ()))
+    for field_type, ops in _FIELD_OPS.items()
+}
+
+# Operations available on reverse relations in metadata responses
+_REVERSE_RELATION_OPS = ("is", "is_not")
+
+# Forward relation field types that metadata extraction recurses into
+_RELATION_FIELDS = (models.ForeignKey, models.OneToOneField, models.ManyToManyField)
+
+# Attribute names of the three Filter groups, in evaluation order
+_FILTER_GROUPS = ("and_operation", "or_operation", "not_operation")
+
+# Operation -> Django lookup suffix, used by condition_to_q. "is"/"is_not"
+# use the bare field path ("is_not" is additionally negated).
+_OP_LOOKUP_SUFFIX = {
+    "is": "",
+    "is_not": "",
+    "lt": "__lt",
+    "lte": "__lte",
+    "gt": "__gt",
+    "gte": "__gte",
+    "icontains": "__icontains",
+}
+
+
+@lru_cache(maxsize=512)
+def get_model_cached(app_label: str, model_name: str):
+    """
+    Resolve a model class through a memoized apps.get_model lookup.
+
+    apps.get_model lowercases, probes the registry and takes its lock on
+    every call; model classes are immutable once the registry is ready, so
+    per-request resolution collapses to one lru_cache probe. LookupError
+    for unknown models propagates uncached, matching apps.get_model.
+    """
+    return apps.get_model(app_label, model_name)
+
+
 def get_field_type_name(field) -> str:
     """
     Map Django field instances to string type names for frontend consumption.
@@ -42,39 +165,26 @@ def get_field_type_name(field) -> str:
         >>> get_field_type_name(field)
         'string'
     """
-    type_mapping = {
-        models.CharField: "string",
-        models.TextField: "text",
-        models.EmailField: "email",
-        models.URLField: "url",
-        models.SlugField: "slug",
-        models.IntegerField: "integer",
-        models.BigIntegerField: "bigint",
-        models.SmallIntegerField: "smallint",
-        models.PositiveIntegerField: "positiveint",
-        models.FloatField: "float",
-        models.DecimalField: "decimal",
-        models.BooleanField: "boolean",
-        models.DateField: "date",
-        models.DateTimeField: "datetime",
-        models.TimeField: "time",
-        models.ForeignKey: "foreignkey",
-        models.OneToOneField: "onetoone",
-        models.ManyToManyField: "manytomany",
-        models.UUIDField: "uuid",
-        models.JSONField: "json",
-        models.FileField: "file",
-        models.ImageField: "image",
-    }
+    # Exact-type hit is a single dict lookup; only genuine subclasses fall
+    # through to the (cached) MRO scan below.
+    type_name = _FIELD_TYPE_NAMES.get(type(field))
+    if type_name is not None:
+        return type_name
+
+    return _field_type_name_for_subclass(type(field))
 
-    for field_class, type_name in type_mapping.items():
-        if isinstance(field, field_class):
+
+@lru_cache(maxsize=None)
+def _field_type_name_for_subclass(field_class) -> str:
+    """Resolve the type name for field classes not listed exactly in the table."""
+    for base_class, type_name in _FIELD_TYPE_NAMES.items():
+        if issubclass(field_class, base_class):
             return type_name
 
     return "unknown"
 
 
-def get_allowed_operations(field) -> List[str]:
+def get_allowed_operations(field) -> tuple:
     """
     Determine which filter operations are valid for a given field type.
 
@@ -87,51 +197,159 @@ def get_allowed_operations(field) -> List[str]:
         field: Django model field instance
 
     Returns:
-        List of allowed operation strings for this field type
+        Tuple of allowed operation strings for this field type. The tuple
+        is shared between calls — callers must not mutate it.
 
     Example:
         >>> field = models.IntegerField()
         >>> get_allowed_operations(field)
-        ['is', 'is_not', 'lt', 'lte', 'gt', 'gte']
-    """
-    FIELD_OPS = {
-        # --- Text fields: support equality and substring search ---
-        models.CharField: ["is", "is_not", "icontains"],
-        models.TextField: ["is", "is_not", "icontains"],
-        models.EmailField: ["is", "is_not", "icontains"],
-        models.SlugField: ["is", "is_not", "icontains"],
-        models.URLField: ["is", "is_not", "icontains"],
-        models.FilePathField: ["is", "is_not", "icontains"],
-        models.GenericIPAddressField: ["is", "is_not", "icontains"],
-        # --- Numeric fields: support equality and comparison ---
-        models.IntegerField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        models.FloatField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        models.DecimalField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        models.PositiveIntegerField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        models.BigIntegerField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        models.SmallIntegerField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        # --- Boolean: only equality checks ---
-        models.BooleanField: ["is", "is_not"],
-        # --- Date/time fields: support equality and comparison ---
-        models.DateField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        models.DateTimeField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        models.TimeField: ["is", "is_not", "lt", "lte", "gt", "gte"],
-        # --- Relations: equality only (or contains for M2M) ---
-        models.ForeignKey: ["is", "is_not"],
-        models.OneToOneField: ["is", "is_not"],
-        models.ManyToManyField: ["is", "is_not", "icontains"],
-        # --- Special types ---
-        models.UUIDField: ["is", "is_not", "icontains"],
-        models.JSONField: ["is", "is_not", "icontains"],
-        models.FileField: ["is", "is_not"],
-        models.ImageField: ["is", "is_not"],
-    }
+        ('is', 'is_not', 'lt', 'lte', 'gt', 'gte')
+    """
+    allowed_ops = _FIELD_OPS.get(type(field))
+    if allowed_ops is None:
+        allowed_ops = _allowed_ops_for_subclass(type(field))
+
+    return allowed_ops
+
+
+@lru_cache(maxsize=None)
+def _allowed_ops_for_subclass(field_class) -> tuple:
+    """Resolve allowed operations for field classes not listed exactly in the table."""
+    for base_class, allowed_ops in _FIELD_OPS.items():
+        if issubclass(field_class, base_class):
+            return allowed_ops
 
-    for field_type, allowed_ops in FIELD_OPS.items():
-        if isinstance(field, field_type):
-            return list(allowed_ops)
+    return ()
 
-    return []
+
+@lru_cache(maxsize=None)
+def _model_fields(model) -> tuple:
+    """
+    Cached tuple of model._meta.get_fields().
+
+    Django reassembles the field list (walking parents and filtering) on
+    every get_fields() call; the result is static per model class, so cache
+    it once per process.
+    """
+    return tuple(model._meta.get_fields())
+
+
+@lru_cache(maxsize=None)
+def _field_names(model) -> frozenset:
+    """Cached set of field names for O(1) existence checks."""
+    return frozenset(f.name for f in _model_fields(model))
+
+
+# Serialized choices keyed on the field instance itself, which also keeps
+# the field alive — an id()-based key could be reused by a new field after
+# a dynamically created model is garbage-collected and serve it another
+# field's choices. str() on choice labels can be expensive for lazy
+# translation proxies, which makes this cache pay off on i18n projects.
+_CHOICES_CACHE: dict = {}
+
+
+def _choices_for(field) -> tuple:
+    """Serialize field.choices to {value, label} pairs, cached per field."""
+    choices = _CHOICES_CACHE.get(field)
+    if choices is None:
+        choices = tuple(
+            {"value": choice[0], "label": str(choice[1])} for choice in field.choices
+        )
+        _CHOICES_CACHE[field] = choices
+    return choices
+
+
+class FieldMeta:
+    """
+    Slot-based container for a single field's metadata.
+
+    extract_field_metadata builds one FieldMeta per field instead of a
+    fresh multi-key dict; the dict shape expected by the API is produced
+    once at the serialization boundary via as_dict(). Optional attributes
+    left as None are omitted from the dict, matching the previous
+    conditional-key behavior.
+    """
+
+    __slots__ = (
+        "name",
+        "type",
+        "label",
+        "required",
+        "primary_key",
+        "allowed_operations",
+        "max_length",
+        "choices",
+        "related_model",
+        "filter_name",
+    )
+
+    def __init__(
+        self,
+        name,
+        type,
+        label,
+        required,
+        allowed_operations,
+        primary_key=None,
+        max_length=None,
+        choices=None,
+        related_model=None,
+        filter_name=None,
+    ):
+        self.name = name
+        self.type = type
+        self.label = label
+        self.required = required
+        self.allowed_operations = allowed_operations
+        self.primary_key = primary_key
+        self.max_length = max_length
+        self.choices = choices
+        self.related_model = related_model
+        self.filter_name = filter_name
+
+    def as_dict(self) -> dict:
+        """Convert to the response dict shape, omitting unset optional keys."""
+        field_info = {
+            "name": self.name,
+            "type": self.type,
+            "label": self.label,
+            "required": self.required,
+        }
+        if self.primary_key is not None:
+            field_info["primary_key"] = self.primary_key
+        field_info["allowed_operations"] = self.allowed_operations
+        if self.max_length is not None:
+            field_info["max_length"] = self.max_length
+        if self.choices is not None:
+            field_info["choices"] = self.choices
+        if self.related_model is not None:
+            field_info["related_model"] = self.related_model
+        if self.filter_name is not None:
+            field_info["filter_name"] = self.filter_name
+        return field_info
+
+
+# Memoized results of extract_field_metadata keyed by (model, max_depth).
+# Model metadata is static for the lifetime of the process, so the traversal
+# only has to run once per model/depth combination.
+_METADATA_CACHE: dict = {}
+
+# JSON-encoded get_model_metadata payloads keyed by
+# (model_name, app_label, max_depth), see get_model_metadata_json.
+_METADATA_JSON_CACHE: dict = {}
+
+
+def clear_metadata_cache() -> None:
+    """
+    Clear the per-process model metadata caches.
+
+    Only needed when the app registry changes at runtime (e.g. tests that
+    install models dynamically or dev-server app reloads).
+    """
+    _METADATA_CACHE.clear()
+    _METADATA_JSON_CACHE.clear()
+    _CHOICES_CACHE.clear()
+    _MODEL_BY_LOWER_NAME.clear()
 
 
 def extract_field_metadata(
@@ -153,11 +371,13 @@ def extract_field_metadata(
         prefix: Field path prefix for nested relations (e.g., "backup_job")
         max_depth: Maximum depth to traverse relations (default: 2)
         current_depth: Current recursion depth (internal use)
-        visited_models: Set of already visited models to prevent cycles (internal use)
+        visited_models: Set of models on the current traversal path, used to
+            prevent cycles (internal use). Entries are removed again on the
+            way back up so sibling branches may revisit the same model.
 
     Returns:
         Tuple of:
-            - List of field metadata dictionaries, each containing:
+            - List of FieldMeta objects, each carrying:
                 - name: Full field path (e.g., "backup_job__name")
                 - type: Field type string
                 - label: Human-readable label
@@ -166,26 +386,30 @@ def extract_field_metadata(
                 - max_length: Maximum length (text fields only)
                 - choices: Available choices (choice fields only)
                 - related_model: Related model name (FK/M2M only)
-            - List of all valid lookup paths for autocomplete
+            - Set of all valid lookup paths for autocomplete
 
     Example:
         >>> fields, lookups = extract_field_metadata(Book, max_depth=2)
-        >>> lookups
-        ['id', ...]
+        >>> sorted(lookups)
+        ['date', 'id', ...]
     """
     if visited_models is None:
         visited_models = set()
 
     model_id = (model._meta.app_label, model._meta.model_name)
     if model_id in visited_models:
-        return [], []
+        return [], set()
 
     visited_models.add(model_id)
 
     fields_metadata = []
-    all_lookups = []
+    all_lookups = set()
 
-    for field in model._meta.get_fields():
+    # Whether relations found at this level will be recursed into — constant
+    # for the whole loop, so compute it once instead of per field.
+    will_descend = current_depth < max_depth
+
+    for field in _model_fields(model):
         is_reverse = isinstance(field, (ManyToOneRel, ManyToManyRel, OneToOneRel))
 
         # Determine field name / accessor
@@ -200,74 +424,73 @@ def extract_field_metadata(
         if is_reverse:
             # Reverse relation metadata
             related_model = field.related_model
-            field_info = {
-                "name": full_field_path,
-                "type": "reverse_relation",
-                "label": field_name,
-                "required": False,
-                "allowed_operations": ["is", "is_not"],
-                "related_model": related_model.__name__,
-                "filter_name": field.related_name
+            field_info = FieldMeta(
+                name=full_field_path,
+                type="reverse_relation",
+                label=field_name,
+                required=False,
+                allowed_operations=_REVERSE_RELATION_OPS,
+                related_model=related_model.__name__,
+                filter_name=field.related_name
                 or field.related_model._meta.model_name,
-            }
+            )
             fields_metadata.append(field_info)
-            all_lookups.append(full_field_path)
+            all_lookups.add(full_field_path)
 
             # Recurse into reverse related model
-            if current_depth < max_depth:
+            if will_descend:
                 related_fields, related_lookups = extract_field_metadata(
                     model=related_model,
                     prefix=full_field_path,
                     max_depth=max_depth,
                     current_depth=current_depth + 1,
-                    visited_models=visited_models.copy(),
+                    visited_models=visited_models,
                 )
                 fields_metadata.extend(related_fields)
-                all_lookups.extend(related_lookups)
+                all_lookups.update(related_lookups)
 
         else:
-            # Forward field metadata
-            field_info = {
-                "name": full_field_path,
-                "type": get_field_type_name(field),
-                "label": str(getattr(field, "verbose_name", field_name)),
-                "required": not getattr(field, "null", True)
-                and not getattr(field, "blank", True),
-                "primary_key": getattr(field, "primary_key", False),
-                "allowed_operations": get_allowed_operations(field),
-            }
-
-            if hasattr(field, "max_length") and field.max_length:
-                field_info["max_length"] = field.max_length
-
-            if hasattr(field, "choices") and field.choices:
-                field_info["choices"] = [
-                    {"value": choice[0], "label": str(choice[1])}
-                    for choice in field.choices
-                ]
-
-            if isinstance(
-                field, (models.ForeignKey, models.OneToOneField, models.ManyToManyField)
-            ):
-                field_info["related_model"] = field.related_model.__name__
+            # Forward field metadata. Every forward field (including virtual
+            # ones like GenericForeignKey) carries these attributes, so plain
+            # attribute access beats getattr-with-default here.
+            field_info = FieldMeta(
+                name=full_field_path,
+                type=get_field_type_name(field),
+                label=str(field.verbose_name),
+                required=not field.null and not field.blank,
+                primary_key=field.primary_key,
+                allowed_operations=get_allowed_operations(field),
+            )
+
+            if field.max_length:
+                field_info.max_length = field.max_length
+
+            if field.choices:
+                field_info.choices = _choices_for(field)
+
+            is_relation = isinstance(field, _RELATION_FIELDS)
+            if is_relation:
+                field_info.related_model = field.related_model.__name__
 
             fields_metadata.append(field_info)
-            all_lookups.append(full_field_path)
+            all_lookups.add(full_field_path)
 
             # Recurse into forward related model
-            if isinstance(
-                field, (models.ForeignKey, models.OneToOneField, models.ManyToManyField)
-            ):
-                if current_depth < max_depth:
+            if is_relation:
+                if will_descend:
                     related_fields, related_lookups = extract_field_metadata(
                         model=field.related_model,
                         prefix=full_field_path,
                         max_depth=max_depth,
                         current_depth=current_depth + 1,
-                        visited_models=visited_models.copy(),
+                        visited_models=visited_models,
                     )
                     fields_metadata.extend(related_fields)
-                    all_lookups.extend(related_lookups)
+                    all_lookups.update(related_lookups)
+
+    # Backtrack so sibling branches may traverse this model again — this
+    # replaces the visited_models.copy() previously done per descent.
+    visited_models.discard(model_id)
 
     return fields_metadata, all_lookups
 
@@ -305,19 +528,141 @@ def get_model_metadata(
         app_label = qlab_settings.DEFAULT_APP_LABEL
     if max_depth is None:
         max_depth = qlab_settings.MAX_RELATION_DEPTH
-    model = apps.get_model(app_label, model_name)
+    model = get_model_cached(app_label, model_name)
 
-    fields, lookups = extract_field_metadata(model, max_depth=max_depth)
+    cached = _METADATA_CACHE.get((model, max_depth))
+    if cached is None:
+        cached = extract_field_metadata(model, max_depth=max_depth)
+        _METADATA_CACHE[(model, max_depth)] = cached
+    fields, lookups = cached
 
     return {
         "model_name": model.__name__,
         "app_label": app_label,
         "primary_key_field": model._meta.pk.name,
-        "fields": fields,
+        "fields": [field_meta.as_dict() for field_meta in fields],
         "all_lookups": sorted(lookups),
     }
 
 
+def get_model_metadata_json(
+    model_name: str, app_label: str = "core", max_depth: int = 2
+) -> bytes:
+    """
+    Get the JSON-encoded get_model_metadata payload as cached bytes.
+
+    Model metadata is immutable within a process lifetime, so the payload
+    is serialized once per (model, app_label, max_depth) and the raw bytes
+    can be returned verbatim from a view, e.g.
+    HttpResponse(payload, content_type="application/json"), without
+    re-running dict construction or json.dumps per request.
+
+    Note: any lazily translated labels are rendered in the language active
+    when the cache entry is built. Projects needing per-request translation
+    of metadata should use get_model_metadata instead.
+
+    Args:
+        model_name: Name of the Django model (e.g., "Book")
+        app_label: Django app containing the model (default: "core")
+        max_depth: Maximum depth for traversing relations (default: 2)
+
+    Returns:
+        UTF-8 encoded JSON bytes of the metadata payload
+
+    Raises:
+        LookupError: If model doesn't exist
+    """
+    if app_label is None:
+        app_label = qlab_settings.DEFAULT_APP_LABEL
+    if max_depth is None:
+        max_depth = qlab_settings.MAX_RELATION_DEPTH
+
+    key = (model_name, app_label, max_depth)
+    payload = _METADATA_JSON_CACHE.get(key)
+    if payload is not None:
+        return payload
+
+    # Second tier: the shared Django cache, so a fleet of workers builds
+    # each model's metadata once instead of once per process. Opt-in
+    # (METADATA_CACHE_TIMEOUT defaults to 0) because backends like Redis
+    # or memcached survive deploys: freshly restarted workers would read
+    # pre-migration bytes until the TTL expires. Enable it only where the
+    # shared cache is flushed on deploy or that staleness is acceptable.
+    timeout = qlab_settings.get("METADATA_CACHE_TIMEOUT", 0)
+    shared_key = f"qlab:meta:{app_label}:{model_name}:{max_depth}"
+    if timeout:
+        from django.core.cache import cache
+
+        payload = cache.get(shared_key)
+        if payload is not None:
+            _METADATA_JSON_CACHE[key] = payload
+            return payload
+
+    metadata = get_model_metadata(model_name, app_label=app_label, max_depth=max_depth)
+    payload = json.dumps(metadata).encode("utf-8")
+    _METADATA_JSON_CACHE[key] = payload
+    if timeout:
+        cache.set(shared_key, payload, timeout=timeout)
+    return payload
+
+
+def canonical_filter_key(filter_obj: Filter) -> tuple:
+    """
+    Build a hashable structural signature for a Filter tree.
+
+    Conditions are frozen (hashable) pydantic models, so the signature is
+    the nested tuple of each group's children with nested Filters replaced
+    by their own signatures. Two trees with identical structure and
+    conditions produce equal keys, making the signature usable as a cache
+    key for the compiled Q object.
+
+    Args:
+        filter_obj: Nested Filter object
+
+    Returns:
+        Nested tuple signature of the tree
+    """
+    return tuple(
+        tuple(
+            canonical_filter_key(item) if type(item) is Filter else item
+            for item in (getattr(filter_obj, group) or ())
+        )
+        for group in _FILTER_GROUPS
+    )
+
+
+# Compiled Q trees per filter signature. Bounded by wholesale clearing:
+# dashboards cycle through a small set of filter shapes, so the cache
+# rarely fills, and clearing is cheaper than tracking recency.
+_Q_CACHE_MAX = 256
+_Q_CACHE: dict = {}
+
+
+def build_q_cached(filter_obj: Filter) -> Q:
+    """
+    Build (or reuse) the Q object for a Filter tree.
+
+    Repeated identical filters — dashboard polling, paging through the
+    same query — skip the tree walk and Q construction entirely and get
+    the previously compiled Q back. Safe to share because QuerySet.filter
+    and the Q combinators never mutate their operands.
+
+    Args:
+        filter_obj: Nested Filter object
+
+    Returns:
+        Django Q object ready to use in QuerySet.filter()
+    """
+    key = canonical_filter_key(filter_obj)
+    q = _Q_CACHE.get(key)
+    if q is None:
+        q = build_q(filter_obj)
+        if len(_Q_CACHE) >= _Q_CACHE_MAX:
+            _Q_CACHE.clear()
+        _Q_CACHE[key] = q
+    return q
+
+
 def build_q(filter_obj: Filter) -> Q:
     """
     Convert a Pydantic Filter object into a Django Q object.
@@ -341,24 +686,39 @@ def build_q(filter_obj: Filter) -> Q:
         >>> q = build_q(filter_obj)
         >>> Book.objects.filter(q)
     """
-    q = Q()
+    # Collect each group's children first, then combine in one shot —
+    # repeatedly doing `q &= ...` / `or_q |= ...` starting from an empty Q()
+    # allocates an intermediate tree node per child.
+    and_children = [
+        build_q(item) if type(item) is Filter else condition_to_q(item)
+        for item in (filter_obj.and_operation or ())
+    ]
+    or_children = [
+        build_q(item) if type(item) is Filter else condition_to_q(item)
+        for item in (filter_obj.or_operation or ())
+    ]
+    not_children = [
+        build_q(item) if type(item) is Filter else condition_to_q(item)
+        for item in (filter_obj.not_operation or ())
+    ]
+
+    # Fast path: a single AND child needs no wrapping at all
+    if len(and_children) == 1 and not or_children and not not_children:
+        return and_children[0]
 
     # AND: All conditions must be true
-    if filter_obj.and_operation:
-        for item in filter_obj.and_operation:
-            q &= build_q(item) if isinstance(item, Filter) else condition_to_q(item)
+    q = Q(*and_children) if and_children else Q()
 
     # OR: At least one condition must be true
-    if filter_obj.or_operation:
-        or_q = Q()
-        for item in filter_obj.or_operation:
-            or_q |= build_q(item) if isinstance(item, Filter) else condition_to_q(item)
-        q |= or_q
+    if or_children:
+        if len(or_children) == 1:
+            q |= or_children[0]
+        else:
+            q |= Q(*or_children, _connector=Q.OR)
 
     # NOT: Negate the conditions
-    if filter_obj.not_operation:
-        for item in filter_obj.not_operation:
-            q &= ~build_q(item) if isinstance(item, Filter) else ~condition_to_q(item)
+    for child in not_children:
+        q &= ~child
 
     return q
 
@@ -384,25 +744,11 @@ def condition_to_q(cond: Condition) -> Q:
         >>> q = condition_to_q(cond)
         >>> # Equivalent to: Q(price__gte=10)
     """
-    lookup = cond.field
-    value = cond.value
-
-    if cond.op == "is":
-        return Q(**{lookup: value})
-    elif cond.op == "is_not":
-        return ~Q(**{lookup: value})
-    elif cond.op == "lt":
-        return Q(**{f"{lookup}__lt": value})
-    elif cond.op == "lte":
-        return Q(**{f"{lookup}__lte": value})
-    elif cond.op == "gt":
-        return Q(**{f"{lookup}__gt": value})
-    elif cond.op == "gte":
-        return Q(**{f"{lookup}__gte": value})
-    elif cond.op == "icontains":
-        return Q(**{f"{lookup}__icontains": value})
+    q = Q(**{cond.field + _OP_LOOKUP_SUFFIX[cond.op]: cond.value})
+    return ~q if cond.op == "is_not" else q
 
 
+@lru_cache(maxsize=4096)
 def is_valid_lookup_syntax(lookup: str) -> bool:
     """
     Validate Django field lookup syntax.
@@ -426,8 +772,11 @@ def is_valid_lookup_syntax(lookup: str) -> bool:
         >>> is_valid_lookup_syntax("spaces not allowed")
         False
     """
-    pattern = r"^[A-Za-z_][A-Za-z0-9_]*(__[A-Za-z_][A-Za-z0-9_]*)*$"
-    return bool(re.match(pattern, lookup))
+    # str.isidentifier is a C builtin that checks exactly the per-segment
+    # rule (leading letter/underscore, alphanumeric/underscore after), so
+    # splitting on the relation separator avoids the regex engine entirely.
+    # Empty segments ("a__", "__a") fail the isidentifier check.
+    return all(part.isidentifier() for part in lookup.split("__"))
 
 
 def flatten_filter_conditions(filter_obj: Filter) -> List[Condition]:
@@ -456,19 +805,37 @@ def flatten_filter_conditions(filter_obj: Filter) -> List[Condition]:
         >>> len(conditions)
         2
     """
-    conditions = []
+    return list(iter_filter_conditions(filter_obj))
+
+
+def iter_filter_conditions(filter_obj: Filter):
+    """
+    Yield all Condition objects from a nested Filter structure.
+
+    Streaming variant of flatten_filter_conditions: walks the tree with an
+    explicit stack and yields conditions as they are found, so callers that
+    can stop early (e.g. the condition-count guardrail) never materialize
+    the full list.
 
-    for group in ["and_operation", "or_operation", "not_operation"]:
-        items = getattr(filter_obj, group) or []
-        for item in items:
-            if isinstance(item, Filter):
-                # Recursively flatten nested filters
-                conditions.extend(flatten_filter_conditions(item))
-            else:
-                # Base case: it's a Condition
-                conditions.append(item)
+    Args:
+        filter_obj: Nested Filter object
+
+    Yields:
+        Condition objects in tree-walk order
+    """
+    stack = [filter_obj]
 
-    return conditions
+    while stack:
+        current = stack.pop()
+        for group in _FILTER_GROUPS:
+            items = getattr(current, group) or ()
+            for item in items:
+                if type(item) is Filter:
+                    # Defer nested filters instead of recursing
+                    stack.append(item)
+                else:
+                    # Base case: it's a Condition
+                    yield item
 
 
 def validate_field_path(model, field_path: str, errors: list) -> bool:
@@ -498,45 +865,69 @@ def validate_field_path(model, field_path: str, errors: list) -> bool:
         >>> errors
         [{'loc': ('field',), 'msg': "Field 'invalid_field' does not exist...", ...}]
     """
+    result = _classify_field_path(model, field_path)
+    kind = result[0]
+
+    if kind == "ok":
+        return True
+    if kind == "missing_suggest":
+        msg = f"Field '{result[1]}' does not exist. Did you mean '{result[2]}'?"
+    elif kind == "missing":
+        msg = f"Field '{result[1]}' does not exist in model {result[2]}"
+    else:  # "not_relation"
+        msg = f"Field '{result[1]}' is not a relation field in model {result[2]}"
+
+    errors.append(
+        {
+            "loc": ("field",),
+            "msg": msg,
+            "type": "value_error",
+        }
+    )
+    return False
+
+
+# All field types that may be traversed with __ in a lookup path
+_RELATION_PATH_TYPES = (
+    ForeignKey,
+    ManyToManyField,
+    OneToOneField,  # forward
+    ManyToOneRel,
+    ManyToManyRel,
+    OneToOneRel,  # reverse
+)
+
+
+@lru_cache(maxsize=4096)
+def _classify_field_path(model, field_path: str) -> tuple:
+    """
+    Pure, memoizable core of validate_field_path.
+
+    Model metadata is static at runtime, so classifying the same
+    (model, field_path) pair always yields the same result — lru_cache
+    turns repeated validation of the same path into a single dict lookup.
+
+    Returns one of:
+        ("ok",)
+        ("missing_suggest", field_path, suggested)
+        ("missing", field_name, model_name)
+        ("not_relation", field_name, model_name)
+    """
     if "__" not in field_path:
         # Simple field (no relations)
-        field_names = [f.name for f in model._meta.get_fields()]
-        if field_path not in field_names:
-            # Try to provide helpful suggestion
+        if field_path not in _field_names(model):
+            # Try to provide helpful suggestion: if the first segment of the
+            # _ -> __ rewrite is a real field, the user probably meant a
+            # relation traversal.
             suggested = field_path.replace("_", "__")
-            if any(
-                suggested.startswith(f.name + "__") for f in model._meta.get_fields()
-            ):
-                errors.append(
-                    {
-                        "loc": ("field",),
-                        "msg": f"Field '{field_path}' does not exist. Did you mean '{suggested}'?",
-                        "type": "value_error",
-                    }
-                )
-            else:
-                errors.append(
-                    {
-                        "loc": ("field",),
-                        "msg": f"Field '{field_path}' does not exist in model {model.__name__}",
-                        "type": "value_error",
-                    }
-                )
-            return False
-        return True
+            if suggested.split("__", 1)[0] in _field_names(model):
+                return ("missing_suggest", field_path, suggested)
+            return ("missing", field_path, model.__name__)
+        return ("ok",)
     else:
         # Related field (has __ separator)
         related_name, remaining_path = field_path.split("__", 1)
 
-        RELATION_TYPES = (
-            ForeignKey,
-            ManyToManyField,
-            OneToOneField,  # forward
-            ManyToOneRel,
-            ManyToManyRel,
-            OneToOneRel,  # reverse
-        )
-
         # Try forward relation first
         try:
             related_field = model._meta.get_field(related_name)
@@ -545,7 +936,7 @@ def validate_field_path(model, field_path: str, errors: list) -> bool:
 
         # Try reverse relation accessors (related_name or model name e.g. book)
         if related_field is None:
-            for f in model._meta.get_fields():
+            for f in _model_fields(model):
                 if isinstance(f, (ManyToOneRel, ManyToManyRel, OneToOneRel)):
                     accessor = f.related_name or f.related_model._meta.model_name
                     if accessor == related_name:
@@ -553,24 +944,10 @@ def validate_field_path(model, field_path: str, errors: list) -> bool:
                         break
 
         if related_field is None:
-            errors.append(
-                {
-                    "loc": ("field",),
-                    "msg": f"Field '{related_name}' does not exist in model {model.__name__}",
-                    "type": "value_error",
-                }
-            )
-            return False
-
-        if not isinstance(related_field, RELATION_TYPES):
-            errors.append(
-                {
-                    "loc": ("field",),
-                    "msg": f"Field '{related_name}' is not a relation field in model {model.__name__}",
-                    "type": "value_error",
-                }
-            )
-            return False
+            return ("missing", related_name, model.__name__)
+
+        if not isinstance(related_field, _RELATION_PATH_TYPES):
+            return ("not_relation", related_name, model.__name__)
 
         # Get related model — works for both forward and reverse
         related_model = (
@@ -578,7 +955,7 @@ def validate_field_path(model, field_path: str, errors: list) -> bool:
             if hasattr(related_field, "related_model")
             else related_field.field.model
         )
-        return validate_field_path(related_model, remaining_path, errors)
+        return _classify_field_path(related_model, remaining_path)
 
 
 def model_exists(model_name: str):
@@ -600,11 +977,22 @@ def model_exists(model_name: str):
         >>> model_exists("NonExistentModel")
         None
     """
+    if not _MODEL_BY_LOWER_NAME:
+        _build_model_index()
+    return _MODEL_BY_LOWER_NAME.get(model_name.lower())
+
+
+# Lowercase model name -> model class, built lazily on the first
+# model_exists() call (i.e. after the app registry is fully populated).
+_MODEL_BY_LOWER_NAME: dict = {}
+
+
+def _build_model_index() -> None:
+    """Index all installed models by lowercase name for O(1) lookups."""
     for app_config in apps.get_app_configs():
         for model in app_config.get_models():
-            if model.__name__.lower() == model_name.lower():
-                return model
-    return None
+            # setdefault keeps the first match, mirroring the old scan order
+            _MODEL_BY_LOWER_NAME.setdefault(model.__name__.lower(), model)
 
 
 def check_attribute_operation(model, field_name: str, op: str) -> bool:
@@ -612,6 +1000,19 @@ def check_attribute_operation(model, field_name: str, op: str) -> bool:
     Validate that an operation is allowed for a specific field type.
     Supports forward relations, reverse relations and related_name accessors via __ paths.
     """
+    return op in _allowed_ops_for_path(model, field_name)
+
+
+@lru_cache(maxsize=4096)
+def _allowed_ops_for_path(model, field_name: str) -> frozenset:
+    """
+    Resolve the set of valid operations for a (possibly __-joined) field path.
+
+    Pure function of static model metadata, so it is memoized per
+    (model, field_name): per-request validation becomes one cache hit and a
+    set-membership test instead of re-walking the relation path. Returns an
+    empty frozenset for paths that do not resolve to a field.
+    """
     try:
         if "__" in field_name:
             parts = field_name.split("__")
@@ -622,7 +1023,7 @@ def check_attribute_operation(model, field_name: str, op: str) -> bool:
                 except FieldDoesNotExist:
                     # Try reverse relation accessor
                     field = None
-                    for f in current_model._meta.get_fields():
+                    for f in _model_fields(current_model):
                         if isinstance(f, (ManyToOneRel, ManyToManyRel, OneToOneRel)):
                             accessor = (
                                 f.related_name or f.related_model._meta.model_name
@@ -631,7 +1032,7 @@ def check_attribute_operation(model, field_name: str, op: str) -> bool:
                                 field = f
                                 break
                     if field is None:
-                        return False
+                        return frozenset()
 
                 if i < len(parts) - 1:
                     current_model = (
@@ -642,57 +1043,20 @@ def check_attribute_operation(model, field_name: str, op: str) -> bool:
         else:
             field = model._meta.get_field(field_name)
     except FieldDoesNotExist:
-        return False
-
-    FIELD_OPS = {
-        # --- Text fields: support equality and substring search ---
-        models.CharField: {
-            "is",
-            "is_not",
-            "icontains",
-            "iexact",
-            "startswith",
-            "endswith",
-        },
-        models.TextField: {
-            "is",
-            "is_not",
-            "icontains",
-            "iexact",
-            "startswith",
-            "endswith",
-        },
-        models.EmailField: {"is", "is_not", "icontains", "iexact"},
-        models.SlugField: {"is", "is_not", "icontains", "iexact"},
-        models.URLField: {"is", "is_not", "icontains", "iexact"},
-        models.FilePathField: {"is", "is_not", "icontains"},
-        models.GenericIPAddressField: {"is", "is_not", "icontains", "iexact"},
-        # --- Numeric fields: support equality and comparison ---
-        models.IntegerField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        models.FloatField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        models.DecimalField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        models.PositiveIntegerField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        models.BigIntegerField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        models.SmallIntegerField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        # --- Boolean: only equality checks ---
-        models.BooleanField: {"is", "is_not"},
-        # --- Date/time fields: support equality and comparison ---
-        models.DateField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        models.DateTimeField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        models.TimeField: {"is", "is_not", "lt", "lte", "gt", "gte"},
-        # --- Relations: equality only (or contains for M2M) ---
-        models.ForeignKey: {"is", "is_not"},
-        models.OneToOneField: {"is", "is_not"},
-        models.ManyToManyField: {"is", "is_not", "icontains"},
-        # --- Special types ---
-        models.UUIDField: {"is", "is_not", "icontains", "iexact"},
-        models.JSONField: {"is", "is_not", "icontains"},
-        models.FileField: {"is", "is_not"},
-        models.ImageField: {"is", "is_not"},
-    }
+        return frozenset()
 
-    # Check if operation is allowed for this field type
-    for field_type, allowed_ops in FIELD_OPS.items():
-        if isinstance(field, field_type) and op in allowed_ops:
-            return True
-    return False
+    # Look up the operations allowed for this field type
+    allowed_ops = _VALIDATION_FIELD_OPS.get(type(field))
+    if allowed_ops is None:
+        allowed_ops = _validation_ops_for_subclass(type(field))
+    return allowed_ops
+
+
+@lru_cache(maxsize=None)
+def _validation_ops_for_subclass(field_class) -> frozenset:
+    """Resolve validation operations for field classes not listed exactly in the table."""
+    for base_class, allowed_ops in _VALIDATION_FIELD_OPS.items():
+        if issubclass(field_class, base_class):
+            return allowed_ops
+
+    return frozenset()
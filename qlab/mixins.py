@@ -12,14 +12,42 @@ Usage:
         permission_classes = [IsAuthenticated, MyCustomPermission]
 """
 
-from django.apps import apps
-from django.core.paginator import Paginator
-from django.db.models import Q
-from drf_spectacular.utils import extend_schema, OpenApiExample, inline_serializer
+import hashlib
+import os
+
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.http import HttpResponse
+from django.utils.functional import cached_property
+
+if os.environ.get("QLAB_SKIP_SPECTACULAR"):
+    # Cold-start escape hatch (e.g. serverless): drf-spectacular's import
+    # chain pulls in schema generators, uritemplate and inflection, costing
+    # hundreds of ms of startup. The decorators below only matter when a
+    # schema is generated, so inert stubs are safe at runtime.
+    def extend_schema(**kwargs):
+        return lambda func: func
+
+    def OpenApiExample(*args, **kwargs):
+        return None
+
+    def inline_serializer(*args, **kwargs):
+        # A bare Serializer satisfies DRF's field contract (e.g. as a
+        # ListField child) without building any declared fields.
+        return serializers.Serializer()
+
+else:
+    from drf_spectacular.utils import extend_schema, OpenApiExample, inline_serializer
+
+from pydantic import ValidationError as PydanticValidationError
 from rest_framework import serializers
 from rest_framework.response import Response
 
-from qlab.helpers import build_q, get_model_metadata
+from qlab.helpers import (
+    get_model_cached,
+    get_model_metadata,
+    get_model_metadata_json,
+)
 from qlab.model_validation import ValidationError
 from qlab.pydantic_filters import QueryFilter
 from qlab.serializers import (
@@ -49,6 +77,94 @@ _ERROR_SCHEMA = inline_serializer(
 )
 
 
+def _freeze(value):
+    """Recursively convert request payload values into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Validated QueryFilter per canonical request body. Validation is a pure
+# function of the payload and static model metadata, so an identical body
+# (dashboard polling, paging with the same filter) can reuse the already
+# validated instance. Bounded by wholesale clearing, like the Q cache.
+_QUERY_FILTER_CACHE_MAX = 256
+_QUERY_FILTER_CACHE: dict = {}
+
+
+def _validated_query_filter(data) -> QueryFilter:
+    """
+    Build (or reuse) a fully validated QueryFilter for a request body.
+
+    Only byte-for-byte identical payloads share an instance, so this never
+    weakens validation — a body that has not been seen before goes through
+    the normal QueryFilter constructor and all its validators. Raises the
+    same ValidationError/KeyError as direct construction.
+    """
+    try:
+        key = (
+            data["model"],
+            _freeze(data["select_fields"]),
+            _freeze(data.get("filter_fields")),
+            data.get("page", 1),
+            data.get("app_label"),
+        )
+        cached = _QUERY_FILTER_CACHE.get(key)
+    except TypeError:
+        # Unhashable payload leaf; skip the cache for this request
+        key = None
+        cached = None
+    if cached is not None:
+        return cached
+
+    query = QueryFilter(
+        model=data["model"],
+        select_fields=data["select_fields"],
+        filter_fields=data.get("filter_fields", None),
+        page=data.get("page", 1),
+        app_label=data.get("app_label", qlab_settings.DEFAULT_APP_LABEL),
+    )
+    if key is not None:
+        if len(_QUERY_FILTER_CACHE) >= _QUERY_FILTER_CACHE_MAX:
+            _QUERY_FILTER_CACHE.clear()
+        _QUERY_FILTER_CACHE[key] = query
+    return query
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the COUNT(*) result in the Django cache.
+
+    Paginating a query costs two DB roundtrips: the page fetch and the
+    count. The count only changes when rows are written, so repeated
+    paginations of the same query (dashboard polling, paging through
+    results) can reuse it for a short TTL and skip the second roundtrip.
+    The cache key is derived from the full SELECT (including any
+    get_queryset() scoping), so differently scoped requests never share
+    a count.
+    """
+
+    def __init__(self, object_list, per_page, cache_key: str, timeout: int):
+        super().__init__(object_list, per_page)
+        self._count_cache_key = cache_key
+        self._count_timeout = timeout
+
+    @cached_property
+    def count(self):
+        return cache.get_or_set(
+            self._count_cache_key,
+            lambda: Paginator.count.func(self),
+            timeout=self._count_timeout,
+        )
+
+
+# Keys a query body must contain; checked explicitly in post() before
+# QueryFilter construction. page is absent because it defaults to 1.
+_REQUIRED_KEYS = ("model", "select_fields")
+
+
 def _check_restricted(model_name: str) -> Optional[Response]:
     """Return a 403 Response if the model is restricted, else None."""
     restricted = [m.lower() for m in (qlab_settings.RESTRICTED_MODELS or [])]
@@ -151,41 +267,55 @@ class QLabMixin:
     )
     def post(self, request):
         """Execute a dynamic QLab query."""
-        try:
-            query = QueryFilter(
-                model=request.data["model"],
-                select_fields=request.data["select_fields"],
-                filter_fields=request.data.get("filter_fields", None),
-                page=request.data.get("page", 1),
-                app_label=request.data.get(
-                    "app_label", qlab_settings.DEFAULT_APP_LABEL
-                ),
-            )
-        except ValidationError as e:
-            return Response(e.errors(), status=400)
-        except KeyError as e:
+        # Check required keys up front instead of letting the dict lookups
+        # below raise KeyError: missing keys are a common client error, the
+        # explicit check skips exception setup/unwind on that path, and it
+        # reports all missing keys at once rather than the first. page is
+        # not required — it defaults to 1.
+        missing = [key for key in _REQUIRED_KEYS if key not in request.data]
+        if missing:
             return Response(
                 {
                     "errors": [
                         {
-                            "loc": [e.args[0]],
-                            "msg": f"{e.args[0]} is required.",
+                            "loc": [key],
+                            "msg": f"{key} is required.",
                             "type": "value_error.missing",
                             "code": "VALUE_ERROR_MISSING",
                         }
+                        for key in missing
                     ]
                 },
                 status=400,
             )
 
+        try:
+            query = _validated_query_filter(request.data)
+        except ValidationError as e:
+            return Response(e.errors(), status=400)
+        except PydanticValidationError as e:
+            # Structural errors from pydantic itself (wrong types, unknown
+            # keys rejected by extra="forbid") — reshape into the qlab
+            # error envelope.
+            return Response(
+                ValidationError(
+                    [
+                        {
+                            "loc": err["loc"],
+                            "msg": err["msg"],
+                            "type": err["type"],
+                        }
+                        for err in e.errors()
+                    ]
+                ).errors(),
+                status=400,
+            )
+
         app_label = query.app_label or qlab_settings.DEFAULT_APP_LABEL
         restricted = _check_restricted(query.model)
         if restricted:
             return restricted
-        model = apps.get_model(app_label, query.model)
-
-        filter_fields = getattr(query, "filter_fields", None)
-        q_obj = build_q(query.filter_fields) if filter_fields else Q()
+        model = get_model_cached(app_label, query.model)
 
         # Always include PK in results even if not in select_fields
         pk_field = model._meta.pk.name
@@ -194,36 +324,138 @@ class QLabMixin:
         if not pk_included:
             select_fields = [pk_field] + select_fields
 
-        # Apply custom scoping via get_queryset(), then apply QLab filters on top
-        raw_results = (
-            self.get_queryset(model).filter(q_obj).order_by("id").values(*select_fields)
-        )
+        # Apply custom scoping via get_queryset(), then apply QLab filters on
+        # top; the unfiltered case skips .filter() entirely — even an empty
+        # Q() costs a queryset clone and an add_q pass.
+        # .values()/.values_list() with __-joined paths compile to a single
+        # SQL query with the needed JOINs and only the requested columns, so
+        # there is no N+1 here and select_related/only would be redundant
+        # (and .only() is incompatible with .values()).
+        base_qs = self.get_queryset(model).order_by("id")
+        if query.filter_fields:
+            base_qs = base_qs.filter(query.q_obj)
+
+        # "tuple" mode emits columns + rows-of-tuples instead of per-row
+        # dicts: one tuple allocation per row instead of a dict with N key
+        # slots, which is the dominant allocator pressure on large pages.
+        tuple_format = qlab_settings.get("RESULT_FORMAT", "records") == "tuple"
+        if tuple_format:
+            raw_results = base_qs.values_list(*select_fields)
+        else:
+            raw_results = base_qs.values(*select_fields)
 
         page_size = min(
             request.data.get("page_size", qlab_settings.PAGE_SIZE),
             qlab_settings.MAX_PAGE_SIZE,
         )
-        paginator = Paginator(raw_results, page_size)
-        page_obj = paginator.page(query.page)
-
-        if not pk_included:
-            results = [{"id": row[pk_field], **row} for row in page_obj.object_list]
+        pagination_style = qlab_settings.get("PAGINATION_STYLE", "paged")
+
+        # Optional whole-page result cache for polling clients: identical
+        # queries within QUERY_CACHE_TTL return the rendered payload from
+        # the Django cache without touching the DB. Like the count cache,
+        # the key is derived from the full compiled SELECT — which includes
+        # any get_queryset() scoping — so differently scoped requests never
+        # share a page. Staleness is bounded by the TTL; there is no
+        # signal-based invalidation, so keep the TTL short.
+        query_cache_ttl = qlab_settings.get("QUERY_CACHE_TTL", 0)
+        query_cache_key = None
+        if query_cache_ttl:
+            query_cache_key = "qlab:query:" + hashlib.sha1(
+                "|".join(
+                    (
+                        str(raw_results.query),
+                        str(query.page),
+                        str(page_size),
+                        str(tuple_format),
+                        pagination_style,
+                    )
+                ).encode()
+            ).hexdigest()
+            cached_data = cache.get(query_cache_key)
+            if cached_data is not None:
+                return Response(cached_data)
+
+        if pagination_style == "cursor":
+            # Cursor-style paging for infinite-scroll clients: fetch one row
+            # beyond the page to learn whether a next page exists and skip
+            # the COUNT(*) query entirely. count/total_pages are omitted
+            # from the response in this mode.
+            offset = (query.page - 1) * page_size
+            window = raw_results[offset : offset + page_size + 1]
+            results = list(window.iterator(chunk_size=min(page_size + 1, 500)))
+            has_next = len(results) > page_size
+            results = results[:page_size]
+            if not (tuple_format or pk_included):
+                results = [{"id": row[pk_field], **row} for row in results]
+
+            data = {
+                "page": query.page,
+                "page_size": page_size,
+                "next": query.page + 1 if has_next else None,
+                "previous": query.page - 1 if query.page > 1 else None,
+            }
+        else:
+            count_timeout = qlab_settings.get("COUNT_CACHE_TIMEOUT", 0)
+            if count_timeout:
+                count_key = (
+                    "qlab:count:"
+                    + hashlib.sha1(str(raw_results.query).encode()).hexdigest()
+                )
+                paginator = CachedCountPaginator(
+                    raw_results, page_size, count_key, count_timeout
+                )
+            else:
+                paginator = Paginator(raw_results, page_size)
+            try:
+                page_obj = paginator.page(query.page)
+            except EmptyPage:
+                if not count_timeout:
+                    raise
+                # A stale cached count can under-report pages that exist
+                # by now; drop the entry, recount from the DB and retry
+                # once. A genuinely out-of-range page still raises, as it
+                # does without the cache.
+                cache.delete(count_key)
+                paginator = CachedCountPaginator(
+                    raw_results, page_size, count_key, count_timeout
+                )
+                page_obj = paginator.page(query.page)
+
+            # Fetch the page through .iterator() so the DB driver streams
+            # rows in chunks (server-side cursor on PostgreSQL) instead of
+            # materializing the page twice — once in the queryset result
+            # cache and once in the response list.
+            rows = page_obj.object_list.iterator(chunk_size=min(page_size, 500))
+            if tuple_format or pk_included:
+                results = list(rows)
+            else:
+                results = [{"id": row[pk_field], **row} for row in rows]
+
+            data = {
+                "count": paginator.count,
+                "page": page_obj.number,
+                "page_size": page_size,
+                "total_pages": paginator.num_pages,
+                "next": page_obj.next_page_number() if page_obj.has_next() else None,
+                "previous": page_obj.previous_page_number()
+                if page_obj.has_previous()
+                else None,
+            }
+        if tuple_format:
+            # The injected pk is the first column, so clients can still
+            # address rows by id.
+            data["columns"] = select_fields
+            data["rows"] = results
         else:
-            results = list(page_obj.object_list)
+            data["results"] = results
 
-        data = {
-            "count": paginator.count,
-            "page": page_obj.number,
-            "page_size": page_size,
-            "total_pages": paginator.num_pages,
-            "next": page_obj.next_page_number() if page_obj.has_next() else None,
-            "previous": page_obj.previous_page_number()
-            if page_obj.has_previous()
-            else None,
-            "results": results,
-        }
+        if query_cache_key is not None:
+            cache.set(query_cache_key, data, timeout=query_cache_ttl)
 
-        return Response(ResponseSerializer(data).data)
+        # .values() already produced JSON-ready dicts of primitives, so the
+        # payload goes straight to the renderer. ResponseSerializer is kept
+        # for the OpenAPI schema above, not for runtime serialization.
+        return Response(data)
 
 
 class NeighborhoodMixin:
@@ -358,7 +590,7 @@ class NeighborhoodMixin:
         if restricted:
             return restricted
         try:
-            model = apps.get_model(app_label, model_name)
+            model = get_model_cached(app_label, model_name)
         except LookupError:
             return Response(
                 {
@@ -496,16 +728,78 @@ class QLabMetadataMixin:
             return Response(serializer.errors, status=400)
 
         model_name = serializer.validated_data["model"]
-        app_label = request.data.get("app_label", qlab_settings.DEFAULT_APP_LABEL)
+        app_label = serializer.validated_data["app_label"]
 
         restricted = _check_restricted(model_name)
         if restricted:
             return restricted
 
-        metadata = get_model_metadata(
+        # Metadata depends only on the model definition, so the JSON bytes
+        # are cached per model and served as-is — no per-request DRF
+        # serialization. ModelMetadataSerializer is kept for the OpenAPI
+        # schema above, not for runtime serialization.
+        metadata_json = get_model_metadata_json(
             model_name,
             app_label=app_label,
             max_depth=qlab_settings.MAX_RELATION_DEPTH,
         )
 
-        return Response(ModelMetadataSerializer(metadata).data)
+        return HttpResponse(metadata_json, content_type="application/json")
+
+
+class QLabQueryWithMetadataMixin(QLabMixin):
+    """
+    Mixin that answers a query and the model's metadata in one roundtrip.
+
+    UI clients typically fetch metadata and then immediately run their
+    first query; each call pays TLS, middleware and auth overhead. This
+    endpoint returns both payloads in a single response so the client can
+    render the query builder and the first result page from one request.
+
+    Accepts the same body as QLabMixin.post. On validation errors the
+    query error response is returned unchanged, without metadata.
+
+    Example:
+        class MyQueryViewSet(QLabQueryWithMetadataMixin, viewsets.ViewSet):
+            permission_classes = [IsAuthenticated, MyCustomPermission]
+    """
+
+    @extend_schema(
+        summary="Execute Query with Model Metadata",
+        description=(
+            "Execute a dynamic query and return the result together with "
+            "the queried model's metadata.\n\n"
+            "Combines the query and metadata endpoints into one roundtrip "
+            "for clients that need both, e.g. query-builder UIs."
+        ),
+        responses={
+            200: inline_serializer(
+                name="QLabQueryWithMetadataResponse",
+                fields={
+                    "metadata": ModelMetadataSerializer(),
+                    "query": ResponseSerializer(),
+                },
+            ),
+            400: _ERROR_SCHEMA,
+        },
+    )
+    def query_with_metadata(self, request):
+        """Execute a QLab query and bundle the model metadata with it."""
+        # Call the class attribute, not self.post: DRF's as_view() rebinds
+        # self.<http method> to the routed action, so under
+        # as_view({'post': 'query_with_metadata'}) self.post IS this
+        # handler and calling it would recurse.
+        response = QLabMixin.post(self, request)
+        if response.status_code != 200:
+            return response
+
+        # post() has already validated the body and passed the restricted
+        # check, so model/app_label can be read from the payload directly.
+        # The metadata dict itself comes from the per-model cache.
+        app_label = request.data.get("app_label") or qlab_settings.DEFAULT_APP_LABEL
+        metadata = get_model_metadata(
+            request.data["model"],
+            app_label=app_label,
+            max_depth=qlab_settings.MAX_RELATION_DEPTH,
+        )
+        return Response({"metadata": metadata, "query": response.data})
@@ -9,10 +9,24 @@ This module defines the core validation models used in the dynamic query system:
 These models ensure type safety and validate query structure before execution.
 """
 
-from pydantic import BaseModel, field_validator
+import sys
+
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import List, Union, Optional
 
 
+# Hoisted to module scope so validate_op does an O(1) frozenset probe per
+# condition instead of rebuilding a list on every call. The tuple twin keeps
+# the error message stable without re-sorting the set on the failure path.
+_ALLOWED_OPS_TUPLE = ("is", "is_not", "lt", "lte", "gt", "gte", "icontains")
+_ALLOWED_OPS = frozenset(_ALLOWED_OPS_TUPLE)
+
+# Accepted spellings of boolean values in Condition.value; a single dict
+# probe replaces separate true/false membership tests.
+_BOOL_COERCE = {"true": True, "True": True, "false": False, "False": False}
+_MISSING = object()
+
+
 class ValidationError(Exception):
     """
     Custom exception for query validation errors.
@@ -34,10 +48,34 @@ class ValidationError(Exception):
         ... }])
     """
 
+    __slots__ = ("_errors", "_single")
+
     def __init__(self, errors: List[dict]):
         self._errors = errors
+        self._single = None
         super().__init__()
 
+    @classmethod
+    def from_single(cls, loc: tuple, msg: str, error_type: str = "value_error"):
+        """
+        Build a single-error ValidationError without materializing the dict.
+
+        Single-raise validators are the common failure path; the error dict
+        is only ever needed once, in .errors(), when the response is
+        rendered — so store the raw triple and defer the allocation.
+
+        Args:
+            loc: Error location tuple (e.g., ("page",))
+            msg: Human-readable error message
+            error_type: Error type identifier (default: "value_error")
+
+        Returns:
+            ValidationError carrying the deferred error
+        """
+        error = cls(None)
+        error._single = (loc, msg, error_type)
+        return error
+
     def errors(self) -> dict:
         """
         Get formatted error dictionary for API response.
@@ -56,8 +94,14 @@ class ValidationError(Exception):
             ...     print(e.errors())
             {'errors': [{'loc': ['field'], 'msg': 'Invalid', 'type': 'value_error', 'code': 'VALUE_ERROR'}]}
         """
+        errors = self._errors
+        if errors is None:
+            # Deferred single error from from_single()
+            loc, msg, error_type = self._single
+            errors = [{"loc": loc, "msg": msg, "type": error_type}]
+
         formatted = []
-        for error in self._errors:
+        for error in errors:
             error_type = error.get("type", "value_error")
             formatted.append(
                 {
@@ -99,9 +143,25 @@ class Condition(BaseModel):
         True
     """
 
+    # Frozen makes conditions hashable (usable directly as dedup/cache
+    # keys); extra="forbid" skips pydantic's unknown-field bookkeeping and
+    # rejects typo'd keys instead of silently dropping them.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     field: str
     op: str
-    value: str
+    value: Union[str, bool]
+
+    @field_validator("field")
+    def intern_field(cls, field: str) -> str:
+        """
+        Intern the field path so repeated requests share one string object.
+
+        The same few hundred field paths recur across requests; interning
+        them at ingress makes downstream comparisons and dict/cache lookups
+        (e.g. the memoized field-path classifier) pointer-equality fast.
+        """
+        return sys.intern(field)
 
     @field_validator("op")
     def validate_op(cls, op: str) -> str:
@@ -130,20 +190,16 @@ class Condition(BaseModel):
             >>> Condition(field="size", op="gte", value="100")  # Valid
             >>> Condition(field="size", op="invalid", value="100")  # Raises ValidationError
         """
-        allowed_ops = ["is", "is_not", "lt", "lte", "gt", "gte", "icontains"]
-        if op not in allowed_ops:
-            raise ValidationError(
-                [
-                    {
-                        "loc": ("operation_type",),
-                        "msg": f"The chosen operation type is not valid. Valid types are: {allowed_ops}",
-                        "type": "value_error",
-                    }
-                ]
+        if op not in _ALLOWED_OPS:
+            raise ValidationError.from_single(
+                ("operation_type",),
+                f"The chosen operation type is not valid. Valid types are: {list(_ALLOWED_OPS_TUPLE)}",
             )
-        return op
+        # Intern so op comparisons in the query builder hit CPython's
+        # pointer-equality fast path.
+        return sys.intern(op)
 
-    @field_validator("value")
+    @field_validator("value", mode="before")
     def validate_value(cls, value: str) -> Union[str, bool]:
         """
         Validate and convert value, handling boolean string conversion.
@@ -171,12 +227,14 @@ class Condition(BaseModel):
             >>> cond.value
             'test'
         """
-        # Convert string boolean representations to actual booleans
-        if value in ["true", "True"]:
-            return True
-        if value in ["false", "False"]:
-            return False
-        return value
+        # Convert string boolean representations to actual booleans.
+        # value may be unhashable here (mode="before" sees raw input);
+        # let the annotation reject such payloads after the probe.
+        try:
+            coerced = _BOOL_COERCE.get(value, _MISSING)
+        except TypeError:
+            return value
+        return value if coerced is _MISSING else coerced
 
 
 class Filter(BaseModel):
@@ -250,10 +308,14 @@ class Filter(BaseModel):
         >>> #                  AND NOT archived = true
     """
 
+    # Defer building the validator core until first use: resolving the
+    # recursive forward reference at import time taxes every process start
+    # (gunicorn workers, management commands) whether or not it validates
+    # a filter. Frozen/forbid match Condition: immutable nodes, typo'd
+    # group names rejected instead of silently ignored.
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
+
     and_operation: Optional[List[Union["Filter", Condition]]] = None
     or_operation: Optional[List[Union["Filter", Condition]]] = None
     not_operation: Optional[List[Union["Filter", Condition]]] = None
 
-
-# Rebuild model to resolve forward references (Filter referencing itself)
-Filter.model_rebuild()
@@ -12,21 +12,69 @@ QueryFilter performs comprehensive validation before query execution,
 ensuring type safety and preventing invalid database queries.
 """
 
+import sys
+
+from functools import cached_property, lru_cache
+
 from pydantic import BaseModel, field_validator, model_validator
 from typing import Optional
-from django.apps import apps
+
+from django.db.models import Q
 
 from qlab.helpers import (
     model_exists,
     is_valid_lookup_syntax,
-    flatten_filter_conditions,
+    iter_filter_conditions,
+    build_q_cached,
     check_attribute_operation,
+    get_model_cached,
     validate_field_path,
 )
 from qlab.model_validation import Filter, ValidationError
 from qlab.settings import qlab_settings
 
 
+def _check_field(model, field: str, errors: list) -> bool:
+    """
+    Validate a single field path: syntax first, then existence in the model.
+
+    Appends rendered error dicts to errors on failure; returns True when the
+    path is valid. Shared by select-field and filter-condition validation.
+    """
+    # First check if the syntax is valid (alphanumeric + underscores + __)
+    if not is_valid_lookup_syntax(field):
+        errors.append(
+            {
+                "loc": ("field",),
+                "msg": f"Field '{field}' syntax is incorrect. Use __ for relations and _ for attributes.",
+                "type": "syntax_error",
+            }
+        )
+        return False
+    else:
+        # Syntax is valid, now check if the field actually exists
+        return validate_field_path(model, field, errors)
+
+
+@lru_cache(maxsize=1024)
+def _validate_select_fields(model, fields: tuple):
+    """
+    Validate a whole select-field tuple once and memoize the outcome.
+
+    Clients tend to re-issue the same query shape (same model, same select
+    set) on every poll, so the per-field loop is a pure function of static
+    model metadata. Returns (field_ok, errors): a per-path verdict map and
+    the tuple of rendered error dicts. Callers must copy field_ok before
+    mutating it and must not mutate the cached error dicts.
+    """
+    errors: list = []
+    field_ok: dict = {}
+    for field in fields:
+        if field not in field_ok:
+            field_ok[field] = _check_field(model, field, errors)
+    return field_ok, tuple(errors)
+
+
 class QueryFilter(BaseModel):
     """
     Main validation model for dynamic query requests.
@@ -82,11 +130,37 @@ class QueryFilter(BaseModel):
     """
 
     model: str
-    select_fields: list[str]
+    select_fields: tuple[str, ...]
     filter_fields: Optional[Filter] = None
     page: int = 1
     app_label: Optional[str] = None
 
+    @cached_property
+    def q_obj(self) -> Q:
+        """
+        The Django Q object compiled from filter_fields.
+
+        Computed once per instance (and backed by the signature-keyed Q
+        cache), so views just read the attribute — reused QueryFilter
+        instances on the warm path skip Q construction entirely. An empty
+        Q() is returned when no filter was given.
+        """
+        return build_q_cached(self.filter_fields) if self.filter_fields else Q()
+
+    @field_validator("select_fields")
+    def intern_select_fields(cls, fields: tuple) -> tuple:
+        """
+        Normalize select-field paths: intern, dedup and freeze as a tuple.
+
+        The same field paths recur across requests; interning them at ingress
+        makes downstream dict/cache lookups (memoized path classification,
+        allowed-ops resolution) pointer-equality fast, matching what
+        Condition does for its field paths. Duplicates sent by clients are
+        dropped (first occurrence wins) and the immutable tuple lets the
+        select-validation cache key on it directly.
+        """
+        return tuple(dict.fromkeys(sys.intern(field) for field in fields))
+
     @field_validator("page")
     def validate_page(cls, page: int) -> int:
         """
@@ -109,15 +183,7 @@ class QueryFilter(BaseModel):
             >>> QueryFilter(model="Test", select_fields=["id"], page=-1)  # ValidationError
         """
         if page < 1:
-            raise ValidationError(
-                [
-                    {
-                        "loc": ("page",),
-                        "msg": "Page must be at least 1.",
-                        "type": "value_error",
-                    }
-                ]
-            )
+            raise ValidationError.from_single(("page",), "Page must be at least 1.")
         return page
 
     @field_validator("model")
@@ -143,14 +209,8 @@ class QueryFilter(BaseModel):
         """
         model_check = model_exists(model)
         if not model_check:
-            raise ValidationError(
-                [
-                    {
-                        "loc": ("model",),
-                        "msg": f"Model '{model}' does not exist.",
-                        "type": "value_error",
-                    }
-                ]
+            raise ValidationError.from_single(
+                ("model",), f"Model '{model}' does not exist."
             )
         return model
 
@@ -191,38 +251,57 @@ class QueryFilter(BaseModel):
         """
         # Get the actual Django model class
         app_label = self.app_label or qlab_settings.DEFAULT_APP_LABEL
-        model = apps.get_model(app_label, self.model)
+        model = get_model_cached(app_label, self.model)
         errors = []
 
         # --- Validate Select Fields ---
-        for field in self.select_fields:
-            self._validate_field(model, field, errors)
+        # Memoized per (model, select tuple): repeated requests with the
+        # same query shape skip the per-field loop entirely. The verdict map
+        # is copied so condition validation below can extend it, and doubles
+        # as the dedup cache — each distinct path is validated (and
+        # reported) once even if it appears in several conditions.
+        cached_ok, select_errors = _validate_select_fields(model, self.select_fields)
+        field_ok = dict(cached_ok)
+        errors.extend(select_errors)
 
         # --- Validate Filter Fields ---
         if self.filter_fields:
-            # Flatten nested filters to get all conditions
-            all_conditions = flatten_filter_conditions(self.filter_fields)
-
-            # Guardrail: max filter conditions
+            # Stream conditions out of the nested filter tree instead of
+            # materializing the full list; the count guardrail below can
+            # then bail out as soon as the limit is crossed.
             max_conditions = qlab_settings.MAX_FILTER_CONDITIONS
-            if len(all_conditions) > max_conditions:
-                errors.append(
-                    {
-                        "loc": ["filter_fields"],
-                        "msg": f"Too many filter conditions. Maximum allowed is {max_conditions}.",
-                        "type": "value_error.max_filter_conditions",
-                    }
-                )
-                raise ValidationError(errors)
-
-            for cond in all_conditions:
-                # First validate the field path exists
-                valid_field = self._validate_field(model, cond.field, errors)
-
-                # Then check if the operation is allowed for this field type
-                if valid_field:
+            condition_errors = []
+            checked_ops = set()
+            for count, cond in enumerate(
+                iter_filter_conditions(self.filter_fields), start=1
+            ):
+                # Guardrail: max filter conditions. Per-condition errors
+                # found so far are dropped so the response matches what a
+                # pre-counted check would have produced.
+                if count > max_conditions:
+                    errors.append(
+                        {
+                            "loc": ["filter_fields"],
+                            "msg": f"Too many filter conditions. Maximum allowed is {max_conditions}.",
+                            "type": "value_error.max_filter_conditions",
+                        }
+                    )
+                    raise ValidationError(errors)
+
+                # First validate the field path exists (once per distinct path)
+                valid_field = field_ok.get(cond.field)
+                if valid_field is None:
+                    valid_field = self._validate_field(
+                        model, cond.field, condition_errors
+                    )
+                    field_ok[cond.field] = valid_field
+
+                # Then check if the operation is allowed for this field type,
+                # once per distinct (field, op) pair
+                if valid_field and (cond.field, cond.op) not in checked_ops:
+                    checked_ops.add((cond.field, cond.op))
                     if not check_attribute_operation(model, cond.field, cond.op):
-                        errors.append(
+                        condition_errors.append(
                             {
                                 "loc": ("filter_fields", cond.field),
                                 "msg": f"Operation '{cond.op}' is not allowed for field '{cond.field}'.",
@@ -230,6 +309,8 @@ class QueryFilter(BaseModel):
                             }
                         )
 
+            errors.extend(condition_errors)
+
         # Raise all collected errors at once for better UX
         if errors:
             raise ValidationError(errors)
@@ -272,16 +353,4 @@ class QueryFilter(BaseModel):
             >>> errors
             [{'loc': ('field',), 'msg': "Field 'invalid_field' does not exist...", ...}]
         """
-        # First check if the syntax is valid (alphanumeric + underscores + __)
-        if not is_valid_lookup_syntax(field):
-            errors.append(
-                {
-                    "loc": ("field",),
-                    "msg": f"Field '{field}' syntax is incorrect. Use __ for relations and _ for attributes.",
-                    "type": "syntax_error",
-                }
-            )
-            return False
-        else:
-            # Syntax is valid, now check if the field actually exists
-            return validate_field_path(model, field, errors)
+        return _check_field(model, field, errors)
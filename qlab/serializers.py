@@ -9,6 +9,7 @@ Defines serializers for:
 
 from rest_framework import serializers
 from qlab.helpers import model_exists
+from qlab.settings import qlab_settings
 
 
 # ---------------------------------------------------------------------------
@@ -84,6 +85,11 @@ class MetaDataRequestSerializer(serializers.Serializer):
     model = serializers.CharField(
         help_text="Model name to retrieve metadata for (case-insensitive)"
     )
+    app_label = serializers.CharField(
+        required=False,
+        default=qlab_settings.DEFAULT_APP_LABEL,
+        help_text="Django app containing the model (defaults to DEFAULT_APP_LABEL)",
+    )
 
     def validate_model(self, value: str) -> str:
         if not model_exists(value):
@@ -112,5 +118,15 @@ class ResponseSerializer(serializers.Serializer):
         allow_null=True, help_text="Previous page number, null if on first page"
     )
     results = serializers.ListField(
-        help_text="List of result objects with the requested fields"
+        required=False,
+        help_text="List of result objects with the requested fields (records format)",
+    )
+    columns = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text="Column names for the rows (tuple format only)",
+    )
+    rows = serializers.ListField(
+        required=False,
+        help_text="List of result rows as arrays in column order (tuple format only)",
     )
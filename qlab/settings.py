@@ -17,6 +17,12 @@ QLAB_DEFAULTS = {
     "MAX_NODES": 100,
     "ALLOWED_APPS": [],
     "RESTRICTED_MODELS": [],
+    "PREWARM_METADATA": False,
+    "COUNT_CACHE_TIMEOUT": 0,
+    "METADATA_CACHE_TIMEOUT": 0,
+    "RESULT_FORMAT": "records",
+    "PAGINATION_STYLE": "paged",
+    "QUERY_CACHE_TTL": 0,
 }
 
 
@@ -40,10 +46,15 @@ class QLABSettings:
         # Merge with defaults
         self.settings = {**QLAB_DEFAULTS, **user_settings}
 
+        # Freeze each setting as a real instance attribute. Attribute reads
+        # like qlab_settings.PAGE_SIZE happen on every request, and the
+        # normal instance-dict path is much cheaper than __getattr__, which
+        # CPython only invokes after the regular lookup has already missed.
+        for key, value in self.settings.items():
+            setattr(self, key, value)
+
     def __getattr__(self, name):
-        """Allow attribute-style access to settings."""
-        if name in self.settings:
-            return self.settings[name]
+        """Fallback for unknown settings; known keys never reach this."""
         raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{name}'")
 
     def get(self, key, default=None):
@@ -35,6 +35,9 @@ setup(
         "drf-spectacular>=0.26",
     ],
     extras_require={
+        "orjson": [
+            "drf-orjson-renderer>=1.7",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-django>=4.5",
@@ -0,0 +1,32 @@
+"""Minimal Django settings for the test suite."""
+
+SECRET_KEY = "test-only-secret-key"
+
+INSTALLED_APPS = [
+    "django.contrib.contenttypes",
+    "django.contrib.auth",
+    "rest_framework",
+    "drf_spectacular",
+    "qlab",
+]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# The tests query django.contrib.auth models
+QLAB_SETTINGS = {
+    "DEFAULT_APP_LABEL": "auth",
+}
+
+USE_TZ = True
+DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
@@ -0,0 +1,101 @@
+import pytest
+from rest_framework import viewsets
+from rest_framework.test import APIRequestFactory
+
+from qlab.mixins import QLabQueryWithMetadataMixin
+
+
+class QueryWithMetadataViewSet(QLabQueryWithMetadataMixin, viewsets.ViewSet):
+    pass
+
+
+@pytest.mark.django_db
+def test_query_with_metadata_through_as_view():
+    """
+    Exercise the combined endpoint through as_view(), as the README wires it.
+
+    DRF's as_view({'post': 'query_with_metadata'}) rebinds self.post to the
+    routed action, so the handler must call QLabMixin.post explicitly —
+    calling self.post would re-enter itself (regression test for a
+    RecursionError under exactly this wiring).
+    """
+    from django.contrib.auth.models import User
+
+    User.objects.create(username="alice")
+
+    view = QueryWithMetadataViewSet.as_view({"post": "query_with_metadata"})
+    request = APIRequestFactory().post(
+        "/api/query-with-metadata/",
+        {"model": "User", "select_fields": ["id", "username"]},
+        format="json",
+    )
+    response = view(request)
+
+    assert response.status_code == 200
+    assert response.data["metadata"]["model_name"] == "User"
+    assert response.data["query"]["results"][0]["username"] == "alice"
+
+
+@pytest.mark.django_db
+def test_query_with_metadata_passes_errors_through():
+    """Validation errors from the query come back unchanged, without metadata."""
+    view = QueryWithMetadataViewSet.as_view({"post": "query_with_metadata"})
+    request = APIRequestFactory().post(
+        "/api/query-with-metadata/",
+        {"model": "NoSuchModel", "select_fields": ["id"]},
+        format="json",
+    )
+    response = view(request)
+
+    assert response.status_code == 400
+    assert "metadata" not in response.data
+
+
+@pytest.mark.django_db
+def test_stale_cached_count_does_not_reject_valid_page(settings):
+    """
+    A stale cached COUNT(*) must not 500 a page that exists in the database.
+
+    Warm the count cache, insert more rows, then request a page beyond the
+    stale count: the view drops the cached entry, recounts and serves the
+    page instead of letting EmptyPage propagate.
+    """
+    from django.contrib.auth.models import User
+
+    settings.QLAB_SETTINGS = {
+        "DEFAULT_APP_LABEL": "auth",
+        "COUNT_CACHE_TIMEOUT": 60,
+        "PAGE_SIZE": 2,
+    }
+    from qlab import settings as qlab_settings_module
+
+    qlab_settings_module.qlab_settings = qlab_settings_module.QLABSettings()
+    import qlab.mixins
+
+    qlab.mixins.qlab_settings = qlab_settings_module.qlab_settings
+    try:
+        from qlab.mixins import QLabMixin
+
+        class QueryViewSet(QLabMixin, viewsets.ViewSet):
+            pass
+
+        view = QueryViewSet.as_view({"post": "post"})
+        body = {"model": "User", "select_fields": ["id", "username"]}
+
+        User.objects.bulk_create(User(username=f"user{i}") for i in range(2))
+        # Warm the cached count at 2 rows / 1 page
+        assert view(APIRequestFactory().post("/api/query/", body, format="json")).data[
+            "total_pages"
+        ] == 1
+
+        User.objects.bulk_create(User(username=f"late{i}") for i in range(3))
+        response = view(
+            APIRequestFactory().post(
+                "/api/query/", {**body, "page": 2}, format="json"
+            )
+        )
+        assert response.status_code == 200
+        assert response.data["count"] == 5
+    finally:
+        qlab_settings_module.qlab_settings = qlab_settings_module.QLABSettings()
+        qlab.mixins.qlab_settings = qlab_settings_module.qlab_settings